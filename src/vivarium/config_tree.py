@@ -29,6 +29,8 @@ For example:
     'value6'
 
 """
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Any, List, Tuple, Dict, Iterable, Optional
 
@@ -102,6 +104,7 @@ class ConfigNode:
         self._layers = layers
         self._values = {}
         self._frozen = False
+        self._frozen_value = None
         self._accessed = False
 
     @property
@@ -135,6 +138,10 @@ class ConfigNode:
 
         """
         self._frozen = True
+        # Values can no longer change, so resolve the outermost layer once
+        # rather than walking the layers on every lookup.
+        if self._values:
+            self._frozen_value = self._get_value_with_source(None)
 
     def get_value(self, layer: Optional[str]) -> Any:
         """Returns the value at the specified layer.
@@ -153,7 +160,10 @@ class ConfigNode:
             If no value has been set at any layer.
 
         """
-        value = self._get_value_with_source(layer)[1]
+        if layer is None and self._frozen_value is not None:
+            value = self._frozen_value[1]
+        else:
+            value = self._get_value_with_source(layer)[1]
         self._accessed = True
         return value
 
@@ -410,9 +420,7 @@ class ConfigTree:
             return data, source
         elif (isinstance(data, str) and data.endswith(('.yaml', '.yml'))) or isinstance(data, Path):
             source = source if source else str(data)
-            with open(data) as f:
-                data = f.read()
-            data = yaml.full_load(data)
+            data = read_yaml_file(data)
             return data, source
         elif isinstance(data, str):
             data = yaml.full_load(data)
@@ -520,3 +528,32 @@ class ConfigTree:
     def __str__(self):
         return '\n'.join(['{}:\n    {}'.format(name, str(c).replace('\n', '\n    '))
                           for name, c in self._children.items()])
+
+
+def read_yaml_file(file_path: Union[str, Path]) -> Any:
+    """Reads and parses a yaml file.
+
+    Parsed files are cached by their modification time and size, so reading
+    an unchanged file again (e.g. once to validate a model specification and
+    once to build it) doesn't parse it again.  Each call gets its own copy of
+    the parsed data.
+
+    Parameters
+    ----------
+    file_path
+        The path to the yaml file to read.
+
+    Returns
+    -------
+    The parsed contents of the file.
+
+    """
+    file_path = Path(file_path).resolve()
+    stat = file_path.stat()
+    return deepcopy(_parse_yaml_file(str(file_path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_file(file_path: str, mtime: int, size: int) -> Any:
+    with open(file_path) as f:
+        return yaml.full_load(f)
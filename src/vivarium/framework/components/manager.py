@@ -41,6 +41,9 @@ class OrderedComponentSet:
 
     def __init__(self, *args):
         self.components = []
+        # Mirrors the names in self.components so membership checks don't
+        # rescan the whole container on every add.
+        self._names = set()
         if args:
             self.update(args)
 
@@ -48,6 +51,7 @@ class OrderedComponentSet:
         if component in self:
             raise ComponentConfigError(f"Attempting to add a component with duplicate name: {component}")
         self.components.append(component)
+        self._names.add(component.name)
 
     def update(self, components: Union[List[Any], Tuple[Any]]):
         for c in components:
@@ -55,12 +59,13 @@ class OrderedComponentSet:
 
     def pop(self) -> Any:
         component = self.components.pop(0)
+        self._names.discard(component.name)
         return component
 
     def __contains__(self, component: Any) -> bool:
         if not hasattr(component, "name"):
             raise ComponentConfigError(f"Component {component} has no name attribute")
-        return component.name in [c.name for c in self.components]
+        return component.name in self._names
 
     def __iter__(self) -> Iterator:
         return iter(self.components)
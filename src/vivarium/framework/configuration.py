@@ -11,9 +11,7 @@ representations of :term:`model specifications <Model Specification>` and
 from pathlib import Path
 from typing import Union, Dict
 
-import yaml
-
-from vivarium.config_tree import ConfigTree, ConfigurationError
+from vivarium.config_tree import ConfigTree, ConfigurationError, read_yaml_file
 from vivarium.framework.plugins import DEFAULT_PLUGINS
 
 
@@ -47,8 +45,7 @@ def validate_model_specification_file(file_path: Union[str, Path]) -> None:
         raise ConfigurationError(f'Model specification files must be in a yaml format. You provided {file_path.suffix}',
                                  value_name=None)
     # Attempt to load
-    with file_path.open() as f:
-        raw_spec = yaml.full_load(f)
+    raw_spec = read_yaml_file(file_path)
     top_keys = set(raw_spec.keys())
     valid_keys = {'plugins', 'components', 'configuration'}
     if not top_keys <= valid_keys:
@@ -18,11 +18,17 @@ Finally, there are a handful of wrapper methods that allow a user or user
 tools to easily setup and run a simulation.
 
 """
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from datetime import timedelta
+import gc
+from numbers import Integral
 from pathlib import Path
 from pprint import pformat
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Iterable
 
 from loguru import logger
+import pandas as pd
 
 from vivarium.config_tree import ConfigTree
 from vivarium.framework.configuration import build_model_specification
@@ -138,25 +144,49 @@ class SimulationContext:
 
     def step(self):
         logger.debug(self._clock.time)
-        for event in self.time_step_events:
+        for event, emitter in self.time_step_emitters.items():
             self._lifecycle.set_state(event)
-            self.time_step_emitters[event](self._population.get_population(True).index)
+            emitter(self._population.get_population_index())
         self._clock.step_forward()
 
     def run(self):
-        while self._clock.time < self._clock.stop_time:
-            self.step()
+        # Keep the collector from re-traversing long-lived setup objects every step,
+        # unless something else already froze objects (gc.freeze is python 3.7+).
+        freeze_setup_objects = hasattr(gc, 'freeze') and gc.get_freeze_count() == 0
+        if freeze_setup_objects:
+            gc.collect()
+            gc.freeze()
+        step_count = self._get_step_count()
+        try:
+            if step_count is None:
+                while self._clock.time < self._clock.stop_time:
+                    self.step()
+            else:
+                for _ in range(step_count):
+                    self.step()
+        finally:
+            if freeze_setup_objects:
+                gc.unfreeze()
+
+    def _get_step_count(self) -> Union[int, None]:
+        # Steps can only be counted up front when clock arithmetic is exact.
+        # Float clocks accumulate rounding error, so they keep comparing times.
+        time, stop_time, step_size = self._clock.time, self._clock.stop_time, self._clock.step_size
+        if isinstance(step_size, timedelta) or all(isinstance(t, Integral) for t in [time, stop_time, step_size]):
+            # Negated floor division rounds up exactly.
+            return int(-((time - stop_time) // step_size))
+        return None
 
     def finalize(self):
         self._lifecycle.set_state('simulation_end')
-        self.end_emitter(self._population.get_population(True).index)
+        self.end_emitter(self._population.get_population_index())
         unused_config_keys = self.configuration.unused_keys()
         if unused_config_keys:
             logger.debug(f"Some configuration keys not used during run: {unused_config_keys}.")
 
     def report(self):
         self._lifecycle.set_state('report')
-        metrics = self._values.get_value('metrics')(self._population.get_population(True).index)
+        metrics = self._values.get_value('metrics')(self._population.get_population_index())
         logger.debug(pformat(metrics))
         return metrics
 
@@ -208,3 +238,46 @@ def run_simulation(model_specification: Union[str, Path, ConfigTree] = None,
     simulation.run()
     simulation.finalize()
     return simulation
+
+
+def run_simulations(model_specification: Union[str, Path],
+                    random_seeds: Iterable[int],
+                    configuration: Dict = None,
+                    max_workers: int = None) -> pd.DataFrame:
+    """Runs independent simulations for a set of random seeds in parallel.
+
+    Each seed is run to completion in its own worker process from the same
+    model specification, with the seed set as ``randomness.random_seed``
+    on top of any provided configuration overrides.
+
+    Parameters
+    ----------
+    model_specification
+        The path to the model specification file to run.
+    random_seeds
+        The random seeds to run the simulation with.
+    configuration
+        Configuration overrides to apply to every simulation.
+    max_workers
+        The maximum number of worker processes to use. Defaults to the
+        number of processors on the machine.
+
+    Returns
+    -------
+    The final metrics of each simulation indexed by random seed.
+
+    """
+    random_seeds = list(random_seeds)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_simulation_with_seed, model_specification, random_seed, configuration)
+                   for random_seed in random_seeds]
+        metrics = [future.result() for future in futures]
+    return pd.DataFrame(metrics, index=pd.Index(random_seeds, name='random_seed'))
+
+
+def _run_simulation_with_seed(model_specification: Union[str, Path], random_seed: int, configuration: Dict = None):
+    # Build the overrides fresh in the worker so no run relies on state
+    # inherited from the parent process.
+    configuration = deepcopy(configuration) if configuration else {}
+    configuration.setdefault('randomness', {})['random_seed'] = random_seed
+    return run_simulation(model_specification, configuration=configuration).report()
@@ -93,6 +93,12 @@ class _EventChannel:
         self.name = f'event_channel_{name}'
         self.manager = manager
         self.listeners = [[] for _ in range(10)]
+        self._ordered_listeners = None
+
+    def add_listener(self, listener: Callable, priority: int):
+        """Adds a listener to this channel at the provided priority level."""
+        self.listeners[priority].append(listener)
+        self._ordered_listeners = None
 
     def emit(self, index: pd.Index, user_data: Dict = None) -> Event:
         """Notifies all listeners to this channel that an event has occurred.
@@ -112,13 +118,15 @@ class _EventChannel:
         """
         if not user_data:
             user_data = {}
-        e = Event(index, user_data,
-                  self.manager.clock() + self.manager.step_size(),
-                  self.manager.step_size())
-
-        for priority_bucket in self.listeners:
-            for listener in priority_bucket:
-                listener(e)
+        step_size = self.manager.step_size()
+        e = Event(index, user_data, self.manager.clock() + step_size, step_size)
+
+        # Listeners are fixed once setup is over, so flatten the priority
+        # buckets once rather than walking them on every emission.
+        if self._ordered_listeners is None:
+            self._ordered_listeners = tuple(listener for bucket in self.listeners for listener in bucket)
+        for listener in self._ordered_listeners:
+            listener(e)
         return e
 
     def __repr__(self):
@@ -209,7 +217,7 @@ class EventManager:
             Number in range(10) used to assign the ordering in which listeners
             process the event.
         """
-        self.get_channel(name).listeners[priority].append(listener)
+        self.get_channel(name).add_listener(listener, priority)
 
     def get_listeners(self, name: str) -> Dict[int, List[Callable]]:
         """Get  all listeners registered for the named event.
@@ -222,10 +230,11 @@ class EventManager:
         Returns
         -------
             A dictionary that maps each priority level of the named event's
-            listeners to a list of listeners at that level.
+            listeners to a list of listeners at that level.  The lists are
+            copies; use :meth:`register_listener` to add listeners.
         """
         channel = self.get_channel(name)
-        return {priority: listeners for priority, listeners in enumerate(channel.listeners) if listeners}
+        return {priority: list(listeners) for priority, listeners in enumerate(channel.listeners) if listeners}
 
     def list_events(self) -> List[Event]:
         """List all event names known to the event system.
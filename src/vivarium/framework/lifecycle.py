@@ -202,6 +202,7 @@ class LifeCycle:
         self._state_names = set()
         self._phase_names = set()
         self._phases = []
+        self._states = {}
         self.add_phase('initialization', ['initialization'], loop=False)
 
     def add_phase(self, phase_name: str, states: List[str], loop):
@@ -235,6 +236,9 @@ class LifeCycle:
         self._state_names.update(states)
         self._phase_names.add(phase_name)
         self._phases.append(new_phase)
+        # State lookups happen on every life cycle transition, so index the
+        # states by name once here instead of searching the phases each time.
+        self._states.update({s.name: s for s in new_phase.states})
 
     def get_state(self, state_name: str) -> LifeCycleState:
         """Retrieve a life cycle state from the life cycle.
@@ -256,8 +260,7 @@ class LifeCycle:
         """
         if state_name not in self:
             raise LifeCycleError(f'Attempting to look up non-existent state {state_name}.')
-        phase = [p for p in self._phases if state_name in p].pop()
-        return phase.get_state(state_name)
+        return self._states[state_name]
 
     def get_state_names(self, phase_name: str) -> List[str]:
         """Retrieve the names of all states in the provided phase.
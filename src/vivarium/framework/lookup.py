@@ -76,6 +76,8 @@ class InterpolatedTable:
         self.extrapolate = extrapolate
         self.interpolation = Interpolation(data, self.key_columns, self.parameter_columns,
                                            order=self.interpolation_order, extrapolate=self.extrapolate)
+        self._year_is_parameter = 'year' in [col for p in self.parameter_columns for col in p]
+        self._fractional_year = (None, None)
 
     def __call__(self, index: pd.Index) -> pd.DataFrame:
         """Get the interpolated values for the rows in ``index``.
@@ -92,14 +94,21 @@ class InterpolatedTable:
         """
         pop = self.population_view.get(index)
         del pop['tracked']
-        if 'year' in [col for p in self.parameter_columns for col in p]:
-            current_time = self.clock()
-            fractional_year = current_time.year
-            fractional_year += current_time.timetuple().tm_yday / 365.25
-            pop['year'] = fractional_year
+        if self._year_is_parameter:
+            pop['year'] = self._get_fractional_year()
 
         return self.interpolation(pop)
 
+    def _get_fractional_year(self) -> float:
+        # Every table call in a time step sees the same clock time, so only
+        # recompute the fractional year when the clock has moved.
+        current_time = self.clock()
+        cached_time, fractional_year = self._fractional_year
+        if current_time != cached_time:
+            fractional_year = current_time.year + current_time.timetuple().tm_yday / 365.25
+            self._fractional_year = (current_time, fractional_year)
+        return fractional_year
+
     def __repr__(self):
         return "InterpolatedTable()"
 
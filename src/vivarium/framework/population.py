@@ -156,7 +156,9 @@ class PopulationView:
         :meth:`subview <PopulationView.subview`
 
         """
-        pop = self._manager.get_population(True).loc[index]
+        # Selecting rows by label already copies them out of the state table,
+        # so there's no need to copy the full table first.
+        pop = self._manager._population.loc[index]
 
         if not index.empty:
             if self._query:
@@ -216,13 +218,15 @@ class PopulationView:
             affected_columns = set(population_update.columns)
 
         affected_columns = set(affected_columns).intersection(self._columns)
-        state_table = self._manager.get_population(True)
+        # Only the affected columns are copied and written back, so work
+        # against the state table directly rather than a copy of all of it.
+        state_table = self._manager._population
         if not self._manager.growing:
             affected_columns = set(affected_columns).intersection(state_table.columns)
 
         for affected_column in affected_columns:
             if affected_column in state_table:
-                new_state_table_values = state_table[affected_column].values
+                new_state_table_values = state_table[affected_column].values.copy()
                 if isinstance(population_update, pd.Series):
                     update_values = population_update.values
                 else:
@@ -529,6 +533,18 @@ class PopulationManager:
             pop = pop[pop.tracked]
         return pop
 
+    def get_population_index(self) -> pd.Index:
+        """Provides the index of the full population state table.
+
+        Unlike :meth:`get_population`, this does not copy the state table.
+
+        Returns
+        -------
+        The index of the population table, including untracked simulants.
+
+        """
+        return self._population.index
+
 
 class PopulationInterface:
     """Provides access to the system for reading and updating the population.
@@ -38,7 +38,6 @@ For mor information, see the Common Random Numbers
 """
 from typing import Union, List, Tuple, Callable, Any
 import hashlib
-import datetime
 
 import numpy as np
 import pandas as pd
@@ -61,6 +60,8 @@ RESIDUAL_CHOICE = object()
 class IndexMap:
     """A key-index mapping with a simple vectorized hash and vectorized lookups."""
     TEN_DIGIT_MODULUS = 10_000_000_000
+    HASH_PRIMES = np.array([2, 3, 5, 7, 11, 13, 17, 19, 23, 27])
+    NANOSECONDS_PER_SECOND = pd.Timedelta(1, unit='s').value
 
     def __init__(self, map_size=1_000_000):
         self._map = pd.Series()
@@ -116,13 +117,15 @@ class IndexMap:
         for i, column_name in enumerate(key_frame.columns):
             column = self.convert_to_ten_digit_int(key_frame[column_name])
 
-            primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 27]
-            out = pd.Series(1, index=column.index)
-            for idx, p in enumerate(primes):
+            # Work on the raw values so each digit pass is plain ndarray
+            # arithmetic rather than a round of index-aligned Series operations.
+            values = column.values
+            out = np.ones(len(values), dtype=np.int64)
+            for idx, p in enumerate(self.HASH_PRIMES):
                 # numpy will almost always overflow here, but it is equivalent to modding
                 # out by 2**64.  Since it's much much larger than our map size
                 # the amount of additional periodicity this introduces is pretty trivial.
-                out *= np.power(p, self.digit(column, idx))
+                out *= np.power(p, self.digit(values, idx))
             new_map += out + salt
 
         return new_map % self.map_size
@@ -143,30 +146,34 @@ class IndexMap:
         Raises
         ------
         RandomnessError :
-            If the column contains data that is neither a datetime-like nor numeric.
+            If the column's dtype is neither datetime-like nor numeric.  Columns of
+            python objects are rejected even if they hold datetimes or numbers.
         """
-        if isinstance(column.iloc[0], datetime.datetime):
-            column = self.clip_to_seconds(column.astype(np.int64))
-        elif np.issubdtype(column.iloc[0], np.integer):
+        if pd.api.types.is_datetime64_any_dtype(column):
+            # Pin the resolution to nanoseconds so the conversion to seconds
+            # doesn't depend on how the column happens to be stored.
+            nanoseconds = column.values.astype('datetime64[ns]').view(np.int64)
+            column = self.clip_to_seconds(pd.Series(nanoseconds, index=column.index))
+        elif pd.api.types.is_integer_dtype(column):
             if not len(column >= 0) == len(column):
                 raise RandomnessError("Values in integer columns must be greater than or equal to zero.")
             column = self.spread(column)
-        elif np.issubdtype(column.iloc[0], np.floating):
+        elif pd.api.types.is_float_dtype(column):
             column = self.shift(column)
         else:
-            raise RandomnessError(f"Unhashable column type {type(column.iloc[0])}. "
+            raise RandomnessError(f"Unhashable column type {column.dtype}. "
                                   "IndexMap accepts datetime like columns and numeric columns.")
         return column
 
     @staticmethod
-    def digit(m: Union[int, pd.Series], n: int) -> Union[int, pd.Series]:
+    def digit(m: Union[int, pd.Series, np.ndarray], n: Union[int, np.ndarray]) -> Union[int, pd.Series, np.ndarray]:
         """Returns the nth digit of each number in m."""
         return (m // (10 ** n)) % 10
 
     @staticmethod
     def clip_to_seconds(m: Union[int, pd.Series]) -> Union[int, pd.Series]:
         """Clips UTC datetime in nanoseconds to seconds."""
-        return m // pd.Timedelta(1, unit='s').value
+        return m // IndexMap.NANOSECONDS_PER_SECOND
 
     def spread(self, m: Union[int, pd.Series]) -> Union[int, pd.Series]:
         """Spreads out integer values to give smaller values more weight."""
@@ -66,14 +66,41 @@ def _groupby_new_state(index, outputs, decisions):
         The first item in each tuple is the name of an output state and the second item
         is a `pandas.Index` representing the simulants to transition into that state.
     """
-    output_map = {o: i for i, o in enumerate(outputs)}
-    groups = pd.Series(index).groupby([output_map[d] for d in decisions])
-    results = [(outputs[i], pd.Index(sub_group.values)) for i, sub_group in groups]
-    selected_outputs = [o for o, _ in results]
-    for output in outputs:
-        if output not in selected_outputs:
-            results.append((output, pd.Index([])))
-    return results
+    # Resolve every decision to the position of its output state in one
+    # vectorized hash lookup rather than a python dictionary lookup per simulant.
+    # Several transitions may lead to the same output, so look decisions up
+    # against the distinct outputs only.
+    distinct_outputs = pd.Index(outputs).drop_duplicates()
+    output_codes = distinct_outputs.get_indexer(decisions)
+    groups = _split_index_by_code(pd.Index(index), output_codes, len(distinct_outputs))
+    return list(zip(distinct_outputs, groups))
+
+
+def _split_index_by_code(index, codes, n_groups):
+    """Splits an index into groups by integer group code.
+
+    Parameters
+    ----------
+    index : `pandas.Index`
+        The simulants to split.
+    codes : `numpy.ndarray`
+        The group code for each simulant in the index.  Simulants with
+        a code of -1 belong to no group.
+    n_groups : int
+        The number of groups.
+
+    Returns
+    -------
+    list of `pandas.Index`
+        The simulants in each group, ordered by group code.  Simulants keep
+        their relative order from the original index within each group.
+    """
+    # A stable sort brings each group together in one pass over the codes
+    # instead of one boolean mask per group.
+    order = np.argsort(codes, kind='stable')
+    sorted_index = index[order]
+    bounds = np.cumsum(np.bincount(codes + 1, minlength=n_groups + 1))
+    return [sorted_index[bounds[i]:bounds[i + 1]] for i in range(n_groups)]
 
 
 class Trigger(Enum):
@@ -437,12 +464,12 @@ class Machine:
         """
         for state, affected in self._get_state_pops(index):
             if not affected.empty:
-                state.next_state(affected.index, event_time, self.population_view.subview([self.state_column]))
+                state.next_state(affected, event_time, self.population_view.subview([self.state_column]))
 
     def cleanup(self, index, event_time):
         for state, affected in self._get_state_pops(index):
             if not affected.empty:
-                state.cleanup_effect(affected.index, event_time)
+                state.cleanup_effect(affected, event_time)
 
     def to_dot(self):
         """Produces a ball and stick graph of this state machine.
@@ -464,8 +491,12 @@ class Machine:
         return dot
 
     def _get_state_pops(self, index):
+        # Callers only need to know who is in each state, so split the index
+        # by state code rather than copying out a sub-table for every state.
         population = self.population_view.get(index)
-        return [[state, population[population[self.state_column] == state.state_id]] for state in self.states]
+        state_codes = pd.Index([state.state_id for state in self.states]).get_indexer(population[self.state_column])
+        state_pops = _split_index_by_code(population.index, state_codes, len(self.states))
+        return [[state, affected] for state, affected in zip(self.states, state_pops)]
 
     def __repr__(self):
         return f"Machine(state_column= {self.state_column})"
@@ -92,11 +92,21 @@ class Interpolation:
         # specify some numeric type for columns so they won't be objects but will updated with whatever
         # column type actually is
         result = pd.DataFrame(index=interpolants.index, columns=self.value_columns, dtype=np.float64)
+        sub_results = []
         for key, sub_table in sub_tables:
             if sub_table.empty:
                 continue
             df = self.interpolations[key](sub_table)
-            result.loc[sub_table.index, self.value_columns] = df.loc[sub_table.index, self.value_columns]
+            sub_results.append(df.loc[sub_table.index, self.value_columns])
+        # Combine the groups once rather than aligning and assigning into the
+        # result group by group.
+        if sub_results:
+            result = pd.concat(sub_results).reindex(interpolants.index)
+            if len(sub_results) > 1:
+                # Each group only fills part of the float table, so numeric
+                # values are upcast to float and everything else to object.
+                result = result.astype({col: np.float64 if dtype.kind in 'iuf' else object
+                                        for col, dtype in result.dtypes.items()})
 
         return result
 
@@ -232,14 +242,14 @@ class Order0Interp:
         self.extrapolate = extrapolate
 
         # (column name used in call, col name for left edge, col name for right):
-        #               [ordered left edges of bins], max right edge (used when extrapolation not allowed)
+        #               ([ordered left edges of bins], max right edge (used when extrapolation not allowed))
         self.parameter_bins = {}
 
         for p in parameter_columns:
-            left_edge = self.data[p[1]].drop_duplicates().sort_values()
-            max_right = self.data[p[2]].drop_duplicates().max()
+            left_edge = np.sort(self.data[p[1]].unique())
+            max_right = self.data[p[2]].max()
 
-            self.parameter_bins[tuple(p)] = {'bins': left_edge.reset_index(drop=True), 'max': max_right}
+            self.parameter_bins[tuple(p)] = (left_edge, max_right)
 
     def __call__(self, interpolants: pd.DataFrame) -> pd.DataFrame:
         """Find the bins for each parameter for each interpolant in interpolants
@@ -260,9 +270,7 @@ class Order0Interp:
         interpolant_bins = pd.DataFrame(index=interpolants.index)
 
         merge_cols = []
-        for cols, d in self.parameter_bins.items():
-            bins = d['bins']
-            max_right = d['max']
+        for cols, (bins, max_right) in self.parameter_bins.items():
             merge_cols.append(cols[1])
             interpolant_col = interpolants[cols[0]]
             if not self.extrapolate and (interpolant_col.min() < bins[0] or interpolant_col.max() >= max_right):
@@ -270,10 +278,10 @@ class Order0Interp:
                                  f'when explicitly set in creation of Interpolation. Extrapolation is currently '
                                  f'off for this interpolation, and parameter {cols[0]} includes data outside of '
                                  f'original bins.')
-            bin_indices = np.digitize(interpolant_col, bins.tolist())
+            bin_indices = np.digitize(interpolant_col, bins)
             # digitize uses 0 to indicate < min and len(bins) for > max so adjust to actual indices into bin_indices
             bin_indices[bin_indices > 0] -= 1
-            interpolant_bins[cols[1]] = bins.loc[bin_indices].values
+            interpolant_bins[cols[1]] = bins[bin_indices]
 
         index = interpolant_bins.index
 
@@ -100,6 +100,16 @@ def test_node_frozen_update():
         n.update('test_val', layer=None, source=None)
 
 
+def test_node_frozen_get_value():
+    n = ConfigNode(['layer_1', 'layer_2'], name='test_node')
+    n.update('test_value_1', layer='layer_1', source=None)
+    n.update('test_value_2', layer='layer_2', source=None)
+    n.freeze()
+    assert n.get_value(layer=None) == 'test_value_2'
+    assert n.get_value(layer='layer_1') == 'test_value_1'
+    assert n.accessed
+
+
 def test_node_bad_layer_update():
     n = ConfigNode(['base'], name='test_node')
     with pytest.raises(ConfigurationKeyError):
@@ -29,3 +29,18 @@ def test_load_yaml_file(tmpdir):
     assert d.test_section.test_key == 'test_value'
     assert d.test_section.test_key2 == 'test_value2'
     assert d.test_section2.test_key == 'test_value3'
+
+
+def test_load_modified_yaml_file(tmpdir):
+    tmp_file = tmpdir.join('test_file.yaml')
+    tmp_file.write(TEST_YAML_ONE)
+
+    d = ConfigTree()
+    d.update(str(tmp_file))
+    assert d.test_section.test_key == 'test_value'
+
+    tmp_file.write(TEST_YAML_ONE.replace('test_value\n', 'test_value_modified\n'))
+
+    d = ConfigTree()
+    d.update(str(tmp_file))
+    assert d.test_section.test_key == 'test_value_modified'
@@ -49,7 +49,7 @@ def test_validate_model_specification_failures(mocker, test_data_dir, test_spec)
     with test_spec.open() as f:
         spec_dict = yaml.full_load(f)
     spec_dict.update({'invalid_key': 'some_value'})
-    load_mock = mocker.patch('vivarium.framework.configuration.yaml.full_load')
+    load_mock = mocker.patch('vivarium.framework.configuration.read_yaml_file')
     load_mock.return_value = spec_dict
     with pytest.raises(ConfigurationError):
         validate_model_specification_file(test_spec)
@@ -84,7 +84,7 @@ def test_build_model_specification_failure(mocker, test_data_dir, test_spec):
     with test_spec.open() as f:
         spec_dict = yaml.full_load(f)
     spec_dict.update({'invalid_key': 'some_value'})
-    load_mock = mocker.patch('vivarium.framework.configuration.yaml.full_load')
+    load_mock = mocker.patch('vivarium.framework.configuration.read_yaml_file')
     load_mock.return_value = spec_dict
     with pytest.raises(ConfigurationError):
         build_model_specification(str(test_spec))
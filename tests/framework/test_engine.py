@@ -1,6 +1,9 @@
+import gc
+
 import pytest
 
-from vivarium.framework.engine import SimulationContext, Builder
+from vivarium.examples import disease_model
+from vivarium.framework.engine import SimulationContext, Builder, run_simulation, run_simulations
 from vivarium.framework.artifact import ArtifactManager, ArtifactInterface
 from vivarium.framework.event import EventManager, EventInterface
 from vivarium.framework.lookup import LookupTableManager, LookupTableInterface
@@ -143,6 +146,77 @@ def test_SimulationContext_step(log, base_config, components):
     assert sim._clock.time == current_time + step_size
 
 
+@pytest.mark.skipif(not hasattr(gc, 'freeze'), reason='gc.freeze requires python 3.7+')
+def test_SimulationContext_run_freezes_gc(base_config, components):
+    sim = SimulationContext(base_config, components)
+    sim.setup()
+    sim.initialize_simulants()
+    freeze_counts = []
+    step = sim.step
+
+    def recording_step():
+        # Counting frozen objects walks all of them, so only check once.
+        if not freeze_counts:
+            freeze_counts.append(gc.get_freeze_count())
+        step()
+
+    sim.step = recording_step
+    sim.run()
+
+    assert freeze_counts[0] > 0
+    assert gc.get_freeze_count() == 0
+
+
+@pytest.mark.skipif(not hasattr(gc, 'freeze'), reason='gc.freeze requires python 3.7+')
+def test_SimulationContext_run_unfreezes_gc_on_error(mocker, base_config, components):
+    sim = SimulationContext(base_config, components)
+    sim.setup()
+    sim.initialize_simulants()
+    mocker.patch.object(sim, 'step', side_effect=RuntimeError)
+
+    with pytest.raises(RuntimeError):
+        sim.run()
+
+    assert gc.get_freeze_count() == 0
+
+
+@pytest.mark.skipif(not hasattr(gc, 'freeze'), reason='gc.freeze requires python 3.7+')
+def test_SimulationContext_run_leaves_existing_gc_freeze(base_config, components):
+    sim = SimulationContext(base_config, components)
+    sim.setup()
+    sim.initialize_simulants()
+
+    gc.freeze()
+    try:
+        sim.run()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.parametrize('start, end, step_size, expected_steps', [
+    (0, 10, 3, 4),
+    (0, 1.5, 0.3, 5),
+    (0, 1.0, 0.1, 11),
+])
+def test_SimulationContext_run_simple_clock(mocker, components, start, end, step_size, expected_steps):
+    plugin_configuration = {'required': {'clock': {'controller': 'vivarium.framework.time.SimpleClock'}}}
+    configuration = {'time': {'start': start, 'end': end, 'step_size': step_size}}
+    sim = SimulationContext(components=components, configuration=configuration,
+                            plugin_configuration=plugin_configuration)
+    sim.setup()
+    sim.initialize_simulants()
+    expected_end = sim._clock.time
+    for _ in range(expected_steps):
+        expected_end += step_size
+    step = mocker.spy(sim, 'step')
+
+    sim.run()
+
+    assert step.call_count == expected_steps
+    assert sim._clock.time == expected_end
+
+
 def test_SimulationContext_finalize(base_config, components):
     sim = SimulationContext(base_config, components)
     listener = [c for c in components if 'listener' in c.args][0]
@@ -162,3 +236,18 @@ def test_SimulationContext_report(base_config, components):
     sim.finalize()
     metrics = sim.report()
     assert metrics['test'] == len([c for c in sim._component_manager._components if isinstance(c, MockComponentB)])
+
+
+def test_run_simulations():
+    model_specification = disease_model.get_model_specification_path()
+    configuration = {'population': {'population_size': 100},
+                     'time': {'end': {'year': 2005, 'month': 7, 'day': 10}}}
+    metrics = run_simulations(model_specification, [0, 1], configuration, max_workers=2)
+
+    assert list(metrics.index) == [0, 1]
+    assert metrics.index.name == 'random_seed'
+    assert (metrics['total_population'] == 100).all()
+    for random_seed in [0, 1]:
+        expected = run_simulation(model_specification,
+                                  configuration={**configuration, 'randomness': {'random_seed': random_seed}})
+        assert metrics.loc[random_seed].to_dict() == expected.report()
@@ -110,6 +110,27 @@ def test_listener_priority(event_init):
     assert np.all(signal)
 
 
+def test_listener_registered_after_emission(event_init):
+    calls = []
+
+    manager = EventManager()
+    manager.clock = lambda: pd.Timestamp(1990, 1, 1)
+    manager.step_size = lambda: pd.Timedelta(30, 'D')
+    manager.add_constraint = lambda f, **kwargs: f
+    emitter = manager.get_emitter('test_event')
+    manager.register_listener('test_event', lambda _: calls.append('listener1'), priority=5)
+    emitter(event_init['orig']['index'])
+    manager.register_listener('test_event', lambda _: calls.append('listener2'), priority=0)
+    emitter(event_init['orig']['index'])
+    # Listeners handed out by the manager are copies, so changing them
+    # doesn't register anything.
+    manager.get_listeners('test_event')[5].append(lambda _: calls.append('listener3'))
+    emitter(event_init['orig']['index'])
+
+    assert calls == ['listener1', 'listener2', 'listener1', 'listener2', 'listener1']
+    assert len(manager.get_listeners('test_event')[5]) == 1
+
+
 def test_contains():
     event = 'test_event'
 
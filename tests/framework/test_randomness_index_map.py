@@ -1,3 +1,4 @@
+import datetime
 from itertools import chain, combinations, product
 
 import pytest
@@ -127,6 +128,34 @@ def test_convert_to_ten_digit_int():
         m.convert_to_ten_digit_int(bad_col)
 
 
+def test_convert_to_ten_digit_int_tz_aware_datetime():
+    m = IndexMap()
+    v = 1234567890
+    naive_col = pd.date_range(pd.to_datetime(v, unit='s'), periods=10, freq='s').to_series()
+    aware_col = naive_col.dt.tz_localize('UTC').dt.tz_convert('US/Pacific')
+
+    assert (m.convert_to_ten_digit_int(aware_col).values == m.convert_to_ten_digit_int(naive_col).values).all()
+
+
+def test_convert_to_ten_digit_int_empty_column():
+    m = IndexMap()
+    assert m.convert_to_ten_digit_int(pd.Series([], dtype=np.int64)).empty
+    assert m.convert_to_ten_digit_int(pd.Series([], dtype=np.float64)).empty
+
+
+@pytest.mark.parametrize('bad_col', [
+    pd.Series(list(pd.date_range('1/1/2000', periods=10)), dtype=object),
+    pd.Series([datetime.datetime(2000, 1, 1)] * 10, dtype=object),
+    pd.Series(range(10), dtype=object),
+    pd.Series(['a', 'b'] * 5, dtype='category'),
+    pd.Series([True, False] * 5),
+])
+def test_convert_to_ten_digit_int_unhashable_dtype(bad_col):
+    m = IndexMap()
+    with pytest.raises(RandomnessError):
+        m.convert_to_ten_digit_int(bad_col)
+
+
 @pytest.mark.skip("This fails because the hash needs work")
 def test_hash_collisions(map_size_and_hashed_values):
     n, h = map_size_and_hashed_values
@@ -3,7 +3,7 @@ import numpy as np
 
 from vivarium import InteractiveContext
 from vivarium.framework.randomness import choice
-from vivarium.framework.state_machine import Machine, State, Transition
+from vivarium.framework.state_machine import Machine, State, Transition, _groupby_new_state, _split_index_by_code
 
 
 def _population_fixture(column, initial_value):
@@ -136,3 +136,42 @@ def test_side_effects():
     assert np.all(simulation.get_population()['count'] == 1)
     machine.transition(simulation.get_population().index, event_time)
     assert np.all(simulation.get_population()['count'] == 2)
+
+
+def test_groupby_new_state_with_repeated_output():
+    a = State('a')
+    b = State('b')
+    outputs = [a, b, a]
+    decisions = pd.Series([a, b, a, a], index=[10, 11, 12, 13])
+
+    groups = dict(_groupby_new_state(decisions.index, outputs, decisions))
+
+    assert set(groups) == {a, b}
+    assert list(groups[a]) == [10, 12, 13]
+    assert list(groups[b]) == [11]
+
+
+def test_split_index_by_code():
+    index = pd.Index([10, 11, 12, 13, 14, 15])
+    codes = np.array([2, -1, 0, 2, -1, 0])
+
+    groups = _split_index_by_code(index, codes, 4)
+
+    assert [list(group) for group in groups] == [[12, 15], [], [10, 13], []]
+
+
+def test_split_index_by_code_keeps_order_within_groups():
+    index = pd.Index(np.random.RandomState(0).permutation(10000))
+    codes = np.random.RandomState(1).randint(-1, 3, size=len(index))
+
+    groups = _split_index_by_code(index, codes, 3)
+
+    for code, group in enumerate(groups):
+        assert group.equals(index[codes == code])
+
+
+def test_split_index_by_code_empty_index():
+    groups = _split_index_by_code(pd.Index([], dtype=np.int64), np.array([], dtype=np.int64), 2)
+
+    assert len(groups) == 2
+    assert all(group.empty for group in groups)
@@ -26,6 +26,13 @@ def test_rate_to_probability():
     assert np.isclose(prob, 0.00099950016662497809)
 
 
+def test_rate_to_probability_clips_large_rates():
+    rate = np.array([0.001, 1000.0])
+    prob = rate_to_probability(rate)
+    assert np.allclose(prob, [0.00099950016662497809, 1.0])
+    assert np.all(rate == [0.001, 1000.0])
+
+
 def test_probability_to_rate():
     prob = np.array([0.00099950016662497809])
     rate = probability_to_rate(prob)
@@ -344,4 +344,42 @@ def test_order_zero_given_call_column():
 
     expected_result = pd.DataFrame({'value': [100, 1, 6, 1, 2.3, 5, 2.3, 5, 2.3]})
 
-    assert i(query).equals(expected_result)
\ No newline at end of file
+    assert i(query).equals(expected_result)
+
+
+def test_order_zero_single_group_keeps_value_dtypes():
+    data = pd.DataFrame({'age_start': [0, 5],
+                         'age_end': [5, 10],
+                         'int_value': [1, 2],
+                         'bool_value': [True, False]})
+
+    i = Interpolation(data, tuple(), [('age', 'age_start', 'age_end')], 0, True)
+
+    query = pd.DataFrame({'age': [1, 6, 2]},
+                         index=[2, 0, 1])
+
+    expected_result = pd.DataFrame({'bool_value': [True, False, True],
+                                    'int_value': [1, 2, 1]},
+                                   index=[2, 0, 1])
+
+    assert i(query).equals(expected_result)
+
+
+def test_order_zero_multiple_groups_upcast_value_dtypes():
+    data = pd.DataFrame({'sex': ['Female', 'Female', 'Male', 'Male'],
+                         'age_start': [0, 5, 0, 5],
+                         'age_end': [5, 10, 5, 10],
+                         'int_value': [1, 2, 3, 4],
+                         'bool_value': [True, False, False, True]})
+
+    i = Interpolation(data, ('sex',), [('age', 'age_start', 'age_end')], 0, True)
+
+    query = pd.DataFrame({'sex': ['Female', 'Male', 'Female'],
+                          'age': [1, 6, 2]},
+                         index=[2, 0, 1])
+
+    expected_result = pd.DataFrame({'bool_value': np.array([True, True, True], dtype=object),
+                                    'int_value': [1.0, 4.0, 1.0]},
+                                   index=[2, 0, 1])
+
+    assert i(query).equals(expected_result)